@@ -1,23 +1,29 @@
 #!/usr/bin/env python3
 """
 File: run_all_gap_scripts.py
-Purpose: Execute all GAP scripts sequentially with proper delays
+Purpose: Execute all GAP scripts (concurrently by default, or sequentially with delays)
 Author: Oksana Sudoma, Claude (Anthropic)
 Date: 2025-11-09
 
 TDD Protocol:
-- Sequential execution (no parallel)
-- 0.5s delays between scripts (prevent IDE crashes)
-- Capture all stdout/stderr
-- Save execution log
+- Concurrent execution: the scripts write disjoint output files
+- --serial: sequential execution with 0.5s delays (prevent IDE crashes)
+- Stream stdout/stderr line by line to the console and per-script log files
+- Stream execution log (JSON lines, one per script) plus a small summary
+- Skip scripts whose output is newer than the source and stamped with its
+  SHA-256 (--force reruns everything)
 - Report success/failure for each script
 """
 
+import argparse
+import asyncio
+import hashlib
 import subprocess
 import time
 import json
 import datetime
 import sys
+import threading
 from pathlib import Path
 
 # === CONFIG ===
@@ -42,17 +48,64 @@ EXPECTED_OUTPUTS = {
     "verify_group_structures.g": "group_structure_verification.json"
 }
 
-def run_gap_script(script_name):
+def script_log_paths(script_name, run_stamp):
     """
-    Execute a single GAP script and capture output.
+    Per-script stdout/stderr log files for one run.
 
     Args:
         script_name: Name of GAP script file
+        run_stamp: Timestamp shared by all files of this run
+
+    Returns:
+        tuple: (stdout_log, stderr_log) paths
+    """
+    stem = Path(script_name).stem
+    return (OUTPUTS_DIR / f"gap_{stem}_{run_stamp}.stdout.log",
+            OUTPUTS_DIR / f"gap_{stem}_{run_stamp}.stderr.log")
+
+def tee_stream(pipe, console, log_path, prefix=""):
+    """
+    Copy a text pipe line by line to the console and to a buffered log file.
+
+    Args:
+        pipe: Text-mode pipe to drain
+        console: sys.stdout or sys.stderr
+        log_path: File receiving the raw lines
+        prefix: Prepended to each console line
+    """
+    with open(log_path, 'w', buffering=65536) as log:
+        for line in pipe:
+            log.write(line)
+            console.write(prefix + line)
+            console.flush()
+
+async def tee_stream_async(stream, console, log_path, prefix=""):
+    """
+    Asyncio variant of tee_stream for asyncio subprocess streams.
+    """
+    with open(log_path, 'w', buffering=65536) as log:
+        async for raw in stream:
+            line = raw.decode(errors="replace")
+            log.write(line)
+            console.write(prefix + line)
+            console.flush()
+
+def run_gap_script(script_name, run_stamp):
+    """
+    Execute a single GAP script, streaming its output as it runs.
+
+    stdout/stderr are echoed line by line and written to per-script log
+    files; the result records the log paths rather than the full text.
+
+    Args:
+        script_name: Name of GAP script file
+        run_stamp: Timestamp shared by all files of this run
 
     Returns:
         dict: Execution results
     """
     script_path = GAP_DIR / script_name
+    stdout_log, stderr_log = script_log_paths(script_name, run_stamp)
 
     print(f"\n{'='*60}")
     print(f"Running: {script_name}")
@@ -61,59 +114,183 @@ def run_gap_script(script_name):
     start_time = time.time()
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [GAP_PATH, "-q", str(script_path)],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            text=True
         )
 
-        elapsed = time.time() - start_time
-
-        # Print stdout
-        if result.stdout:
-            print(result.stdout)
-
-        # Print stderr (if any)
-        if result.stderr:
-            print(f"STDERR:\n{result.stderr}", file=sys.stderr)
+        readers = [
+            threading.Thread(target=tee_stream, args=(proc.stdout, sys.stdout, stdout_log)),
+            threading.Thread(target=tee_stream, args=(proc.stderr, sys.stderr, stderr_log, "STDERR: "))
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = proc.wait(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            for reader in readers:
+                reader.join()
+            print(f"ERROR: {script_name} timed out after 5 minutes")
+            return {
+                "script": script_name,
+                "returncode": -1,
+                "stdout_log": str(stdout_log),
+                "stderr_log": str(stderr_log),
+                "error": "Timeout after 300 seconds",
+                "elapsed_seconds": 300.0,
+                "success": False,
+                "timestamp": datetime.datetime.now().isoformat()
+            }
+
+        for reader in readers:
+            reader.join()
 
-        success = result.returncode == 0
+        elapsed = time.time() - start_time
 
         return {
             "script": script_name,
-            "returncode": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "returncode": returncode,
+            "stdout_log": str(stdout_log),
+            "stderr_log": str(stderr_log),
             "elapsed_seconds": round(elapsed, 2),
-            "success": success,
+            "success": returncode == 0,
             "timestamp": datetime.datetime.now().isoformat()
         }
 
-    except subprocess.TimeoutExpired:
-        print(f"ERROR: {script_name} timed out after 5 minutes")
+    except Exception as e:
+        print(f"ERROR: {script_name} failed with exception: {e}")
         return {
             "script": script_name,
             "returncode": -1,
-            "stdout": "",
-            "stderr": "Timeout after 300 seconds",
-            "elapsed_seconds": 300.0,
+            "error": str(e),
+            "elapsed_seconds": 0.0,
             "success": False,
             "timestamp": datetime.datetime.now().isoformat()
         }
 
+async def run_gap_script_async(script_name, run_stamp):
+    """
+    Execute a single GAP script as an asyncio subprocess, streaming its output.
+
+    Console lines are prefixed with the script name since several scripts
+    print at once.
+
+    Args:
+        script_name: Name of GAP script file
+        run_stamp: Timestamp shared by all files of this run
+
+    Returns:
+        dict: Execution results (same layout as run_gap_script)
+    """
+    script_path = GAP_DIR / script_name
+    stdout_log, stderr_log = script_log_paths(script_name, run_stamp)
+    prefix = f"[{Path(script_name).stem}] "
+
+    print(f"Started: {script_name}")
+
+    start_time = time.time()
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            GAP_PATH, "-q", str(script_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=1 << 20
+        )
+
+        readers = asyncio.gather(
+            tee_stream_async(proc.stdout, sys.stdout, stdout_log, prefix),
+            tee_stream_async(proc.stderr, sys.stderr, stderr_log, prefix + "STDERR: ")
+        )
+
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=300)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            await readers
+            print(f"ERROR: {script_name} timed out after 5 minutes")
+            return {
+                "script": script_name,
+                "returncode": -1,
+                "stdout_log": str(stdout_log),
+                "stderr_log": str(stderr_log),
+                "error": "Timeout after 300 seconds",
+                "elapsed_seconds": 300.0,
+                "success": False,
+                "timestamp": datetime.datetime.now().isoformat()
+            }
+
+        await readers
+        elapsed = time.time() - start_time
+
+        return {
+            "script": script_name,
+            "returncode": proc.returncode,
+            "stdout_log": str(stdout_log),
+            "stderr_log": str(stderr_log),
+            "elapsed_seconds": round(elapsed, 2),
+            "success": proc.returncode == 0,
+            "timestamp": datetime.datetime.now().isoformat()
+        }
+
     except Exception as e:
         print(f"ERROR: {script_name} failed with exception: {e}")
         return {
             "script": script_name,
             "returncode": -1,
-            "stdout": "",
-            "stderr": str(e),
+            "error": str(e),
             "elapsed_seconds": 0.0,
             "success": False,
             "timestamp": datetime.datetime.now().isoformat()
         }
 
+async def run_all_concurrently(log, run_stamp, force=False):
+    """
+    Launch every script at once and wait for all of them.
+
+    Each result is verified and appended to the log as soon as its script
+    finishes, so a crash later in the run still leaves a partial log.
+
+    Args:
+        log: Open execution log file
+        run_stamp: Timestamp shared by all files of this run
+        force: Rerun scripts whose output is current
+
+    Returns:
+        list: Execution results, in SCRIPTS order
+    """
+    async def run_and_log(script):
+        if not force and output_is_current(script):
+            result = cached_result(script)
+        else:
+            clear_stamp(script)
+            result = await run_gap_script_async(script, run_stamp)
+            result["output_verified"] = verify_outputs(script)
+            if result["success"] and result["output_verified"]:
+                write_stamp(script)
+        write_log_record(log, result)
+        return result
+
+    return await asyncio.gather(*[run_and_log(script) for script in SCRIPTS])
+
+def write_log_record(log, record):
+    """
+    Append one compact JSON record to the execution log and flush it.
+
+    Args:
+        log: Open execution log file
+        record: JSON-serializable dict
+    """
+    log.write(json.dumps(record, separators=(',', ':')) + "\n")
+    log.flush()
+
 def verify_outputs(script_name):
     """
     Verify that expected output file exists.
@@ -138,70 +315,221 @@ def verify_outputs(script_name):
 
     return exists
 
-def main():
+def source_digest(script_name):
+    """
+    SHA-256 of a GAP script's source.
+
+    Args:
+        script_name: Name of GAP script
+
+    Returns:
+        str: Hex digest
+    """
+    return hashlib.sha256((GAP_DIR / script_name).read_bytes()).hexdigest()
+
+def stamp_path(output_path):
+    """
+    Stamp file recording which source produced an output.
+    """
+    return output_path.with_name(output_path.name + ".stamp")
+
+def output_is_current(script_name):
+    """
+    Check whether a script's output can be reused instead of rerunning GAP.
+
+    The output must be non-empty, newer than the script, and stamped with
+    the SHA-256 of the current source (so edits, moves and renames that
+    preserve mtimes still invalidate it).
+
+    Args:
+        script_name: Name of GAP script
+
+    Returns:
+        bool: True if the cached output is current
+    """
+    expected_output = EXPECTED_OUTPUTS.get(script_name)
+    if not expected_output:
+        return False  # Nothing to check against
+
+    output_path = OUTPUTS_DIR / expected_output
+    try:
+        output_stat = output_path.stat()
+        if output_stat.st_size == 0:
+            return False
+        if output_stat.st_mtime <= (GAP_DIR / script_name).stat().st_mtime:
+            return False
+        return stamp_path(output_path).read_text().strip() == source_digest(script_name)
+    except OSError:
+        return False
+
+def write_stamp(script_name):
+    """
+    Record the source SHA-256 next to a freshly generated output.
+
+    Args:
+        script_name: Name of GAP script
+    """
+    expected_output = EXPECTED_OUTPUTS.get(script_name)
+    if expected_output:
+        stamp_path(OUTPUTS_DIR / expected_output).write_text(source_digest(script_name) + "\n")
+
+def clear_stamp(script_name):
+    """
+    Remove a script's stamp before it runs, so a failed or interrupted run
+    cannot leave a partial output that still looks current.
+
+    Args:
+        script_name: Name of GAP script
+    """
+    expected_output = EXPECTED_OUTPUTS.get(script_name)
+    if expected_output:
+        stamp_path(OUTPUTS_DIR / expected_output).unlink(missing_ok=True)
+
+def cached_result(script_name):
+    """
+    Execution result for a script skipped because its output is current.
+
+    Args:
+        script_name: Name of GAP script
+
+    Returns:
+        dict: Execution results
+    """
+    print(f"Skipped (cached): {script_name}")
+    return {
+        "script": script_name,
+        "returncode": 0,
+        "status": "skipped (cached)",
+        "elapsed_seconds": 0.0,
+        "success": True,
+        "output_verified": True,
+        "timestamp": datetime.datetime.now().isoformat()
+    }
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+    """
+    parser = argparse.ArgumentParser(description="Execute all GAP scripts")
+    parser.add_argument(
+        "--serial", action="store_true",
+        help="run scripts one at a time with 0.5s delays (crash prevention)"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="rerun every script even if its output is current"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """
     Main execution loop.
     """
+    args = parse_args(argv)
+
     print("="*60)
     print("GAP SCRIPT EXECUTION SUITE")
     print("="*60)
     print(f"Base path: {BASE_PATH}")
     print(f"GAP executable: {GAP_PATH}")
     print(f"Scripts to run: {len(SCRIPTS)}")
+    print(f"Execution mode: {'serial' if args.serial else 'concurrent'}")
     print(f"Execution order: {', '.join(SCRIPTS)}")
     print("="*60)
 
     # Ensure outputs directory exists
     OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Execution log: one compact JSON record per line, written as scripts finish
+    run_stamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    log_file = OUTPUTS_DIR / f"verification_run_log_{run_stamp}.jsonl"
+    summary_file = OUTPUTS_DIR / f"verification_run_summary_{run_stamp}.json"
+
     # Results accumulator
     all_results = []
     failed_scripts = []
 
-    # Execute each script sequentially
-    for i, script in enumerate(SCRIPTS):
-        print(f"\n[{i+1}/{len(SCRIPTS)}] Executing {script}...")
-
-        # Run script
-        result = run_gap_script(script)
-        all_results.append(result)
-
-        # Verify output
-        output_verified = verify_outputs(script)
-        result["output_verified"] = output_verified
-
-        # Check for failure
-        if not result["success"]:
-            print(f"\n✗ {script} FAILED (return code: {result['returncode']})")
-            failed_scripts.append(script)
-            break  # Stop on first failure
-        elif not output_verified:
-            print(f"\n✗ {script} completed but output missing")
-            failed_scripts.append(script)
-            break
-        else:
-            print(f"\n✓ {script} completed successfully ({result['elapsed_seconds']}s)")
-
-        # Delay before next script (crash prevention)
-        if i < len(SCRIPTS) - 1:
-            print(f"Pausing 0.5 seconds before next script...")
-            time.sleep(0.5)
-
-    # Save execution log
-    log_file = OUTPUTS_DIR / f"verification_run_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(log_file, 'w') as f:
-        json.dump({
+    with open(log_file, 'w', buffering=65536) as log:
+        write_log_record(log, {
             "metadata": {
                 "date": datetime.datetime.now().isoformat(),
                 "gap_path": GAP_PATH,
-                "scripts_executed": len(all_results),
                 "scripts_planned": len(SCRIPTS),
-                "all_succeeded": len(failed_scripts) == 0
-            },
-            "results": all_results
+                "mode": "serial" if args.serial else "concurrent",
+                "force": args.force
+            }
+        })
+
+        if args.serial:
+            # Execute each script sequentially
+            for i, script in enumerate(SCRIPTS):
+                print(f"\n[{i+1}/{len(SCRIPTS)}] Executing {script}...")
+
+                # Reuse current output
+                if not args.force and output_is_current(script):
+                    result = cached_result(script)
+                    all_results.append(result)
+                    write_log_record(log, result)
+                    print(f"\n✓ {script} skipped (cached)")
+                    continue
+
+                # Run script
+                clear_stamp(script)
+                result = run_gap_script(script, run_stamp)
+                all_results.append(result)
+
+                # Verify output
+                output_verified = verify_outputs(script)
+                result["output_verified"] = output_verified
+                write_log_record(log, result)
+
+                # Check for failure
+                if not result["success"]:
+                    print(f"\n✗ {script} FAILED (return code: {result['returncode']})")
+                    failed_scripts.append(script)
+                    break  # Stop on first failure
+                elif not output_verified:
+                    print(f"\n✗ {script} completed but output missing")
+                    failed_scripts.append(script)
+                    break
+                else:
+                    write_stamp(script)
+                    print(f"\n✓ {script} completed successfully ({result['elapsed_seconds']}s)")
+
+                # Delay before next script (crash prevention)
+                if i < len(SCRIPTS) - 1:
+                    print(f"Pausing 0.5 seconds before next script...")
+                    time.sleep(0.5)
+        else:
+            # Execute all scripts at once, then report each in order
+            print(f"\nLaunching {len(SCRIPTS)} scripts concurrently...")
+            all_results = asyncio.run(run_all_concurrently(log, run_stamp, args.force))
+
+            for script, result in zip(SCRIPTS, all_results):
+                if not result["success"]:
+                    print(f"✗ {script} FAILED (return code: {result['returncode']})")
+                    failed_scripts.append(script)
+                elif not result["output_verified"]:
+                    print(f"✗ {script} completed but output missing")
+                    failed_scripts.append(script)
+                elif "status" in result:
+                    print(f"✓ {script} {result['status']}")
+                else:
+                    print(f"✓ {script} completed successfully ({result['elapsed_seconds']}s)")
+
+    # Small pretty-printed summary alongside the streamed log
+    with open(summary_file, 'w') as f:
+        json.dump({
+            "date": datetime.datetime.now().isoformat(),
+            "log_file": log_file.name,
+            "scripts_executed": len(all_results),
+            "scripts_planned": len(SCRIPTS),
+            "failed_scripts": failed_scripts,
+            "all_succeeded": len(failed_scripts) == 0
         }, f, indent=2)
 
     print(f"\nExecution log saved to: {log_file}")
+    print(f"Summary saved to: {summary_file}")
 
     # Final summary
     print("\n" + "="*60)
@@ -7,10 +7,18 @@ Updated: 2025-11-09
 
 Master Verification Runner
 Executes all GAP scripts and generates complete output suite
+(concurrently by default; --serial runs them one at a time). Scripts whose
+output is newer than the source and stamped with its SHA-256 are skipped
+unless --force is given.
 """
 
+import argparse
+import asyncio
+import hashlib
 import subprocess
 import json
+import sys
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
@@ -20,7 +28,8 @@ GAP_DIR = Path(__file__).parent / "gap"
 OUTPUTS_DIR = Path(__file__).parent / "outputs"
 GAP_BINARY = "gap"  # Assumes GAP is in PATH
 
-# Scripts to run (in order)
+# Scripts to run (in order with --serial; they write disjoint outputs, so by
+# default they run concurrently)
 SCRIPTS = [
     {
         "name": "Row Stochastic (432)",
@@ -49,37 +58,139 @@ SCRIPTS = [
 ]
 
 
-def run_gap_script(script_name: str) -> dict:
-    """Execute single GAP script and capture output"""
+def script_log_paths(script_name: str, timestamp: str) -> tuple:
+    """Per-script stdout/stderr log files for one run"""
+    stem = Path(script_name).stem
+    return (OUTPUTS_DIR / f"gap_{stem}_{timestamp}.stdout.log",
+            OUTPUTS_DIR / f"gap_{stem}_{timestamp}.stderr.log")
+
+
+def tee_stream(pipe, console, log_path: Path, prefix: str = "") -> None:
+    """Copy a text pipe line by line to the console and a buffered log file"""
+    with open(log_path, 'w', buffering=65536) as log:
+        for line in pipe:
+            log.write(line)
+            console.write(prefix + line)
+            console.flush()
+
+
+async def tee_stream_async(stream, console, log_path: Path, prefix: str = "") -> None:
+    """Asyncio variant of tee_stream"""
+    with open(log_path, 'w', buffering=65536) as log:
+        async for raw in stream:
+            line = raw.decode(errors="replace")
+            log.write(line)
+            console.write(prefix + line)
+            console.flush()
+
+
+def run_gap_script(script_name: str, timestamp: str) -> dict:
+    """Execute single GAP script, streaming output to console and log files"""
     script_path = GAP_DIR / script_name
+    stdout_log, stderr_log = script_log_paths(script_name, timestamp)
 
     print(f"\n  Running: {script_name}...")
     start_time = time.time()
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             [GAP_BINARY, "-q", str(script_path)],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1,
+            text=True
         )
 
+        readers = [
+            threading.Thread(target=tee_stream, args=(proc.stdout, sys.stdout, stdout_log, "    ")),
+            threading.Thread(target=tee_stream, args=(proc.stderr, sys.stderr, stderr_log, "    "))
+        ]
+        for reader in readers:
+            reader.start()
+
+        try:
+            returncode = proc.wait(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            for reader in readers:
+                reader.join()
+            return {
+                "script": script_name,
+                "success": False,
+                "error": "Timeout (>300s)",
+                "stdout_log": str(stdout_log),
+                "stderr_log": str(stderr_log)
+            }
+
+        for reader in readers:
+            reader.join()
+
         elapsed = time.time() - start_time
 
         return {
             "script": script_name,
-            "success": result.returncode == 0,
+            "success": returncode == 0,
             "elapsed_sec": round(elapsed, 2),
-            "stdout": result.stdout,
-            "stderr": result.stderr
+            "stdout_log": str(stdout_log),
+            "stderr_log": str(stderr_log)
         }
 
-    except subprocess.TimeoutExpired:
+    except Exception as e:
         return {
             "script": script_name,
             "success": False,
-            "error": "Timeout (>300s)"
+            "error": str(e)
+        }
+
+
+async def run_gap_script_async(script_name: str, timestamp: str) -> dict:
+    """Execute single GAP script as an asyncio subprocess, streaming its output"""
+    script_path = GAP_DIR / script_name
+    stdout_log, stderr_log = script_log_paths(script_name, timestamp)
+    prefix = f"    [{Path(script_name).stem}] "
+
+    print(f"  Started: {script_name}")
+    start_time = time.time()
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            GAP_BINARY, "-q", str(script_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=1 << 20
+        )
+
+        readers = asyncio.gather(
+            tee_stream_async(proc.stdout, sys.stdout, stdout_log, prefix),
+            tee_stream_async(proc.stderr, sys.stderr, stderr_log, prefix)
+        )
+
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=300)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            await readers
+            return {
+                "script": script_name,
+                "success": False,
+                "error": "Timeout (>300s)",
+                "stdout_log": str(stdout_log),
+                "stderr_log": str(stderr_log)
+            }
+
+        await readers
+        elapsed = time.time() - start_time
+
+        return {
+            "script": script_name,
+            "success": proc.returncode == 0,
+            "elapsed_sec": round(elapsed, 2),
+            "stdout_log": str(stdout_log),
+            "stderr_log": str(stderr_log)
         }
+
     except Exception as e:
         return {
             "script": script_name,
@@ -88,44 +199,152 @@ def run_gap_script(script_name: str) -> dict:
         }
 
 
-def main():
+async def run_all_concurrently(log, timestamp: str, force: bool = False) -> list:
+    """Launch every script at once; results come back in SCRIPTS order"""
+    async def run_and_log(item):
+        if not force and output_is_current(item):
+            result = cached_result(item)
+        else:
+            clear_stamp(item)
+            result = await run_gap_script_async(item["script"], timestamp)
+            stamp_if_generated(item, result)
+        write_log_record(log, result)
+        return result
+
+    return await asyncio.gather(*[run_and_log(item) for item in SCRIPTS])
+
+
+def source_digest(item: dict) -> str:
+    """SHA-256 of a GAP script's source"""
+    return hashlib.sha256((GAP_DIR / item["script"]).read_bytes()).hexdigest()
+
+
+def stamp_path(item: dict) -> Path:
+    """Stamp file recording which source produced an output"""
+    return OUTPUTS_DIR / (item["output"] + ".stamp")
+
+
+def output_is_current(item: dict) -> bool:
+    """Output is non-empty, newer than its script, and stamped with the source SHA-256"""
+    output_path = OUTPUTS_DIR / item["output"]
+    try:
+        output_stat = output_path.stat()
+        if output_stat.st_size == 0:
+            return False
+        if output_stat.st_mtime <= (GAP_DIR / item["script"]).stat().st_mtime:
+            return False
+        return stamp_path(item).read_text().strip() == source_digest(item)
+    except OSError:
+        return False
+
+
+def clear_stamp(item: dict) -> None:
+    """Drop the stamp before a run, so a failed or partial output never reads as current"""
+    stamp_path(item).unlink(missing_ok=True)
+
+
+def stamp_if_generated(item: dict, result: dict) -> None:
+    """Record the source SHA-256 next to an output the script just produced"""
+    if result["success"] and (OUTPUTS_DIR / item["output"]).exists():
+        stamp_path(item).write_text(source_digest(item) + "\n")
+
+
+def cached_result(item: dict) -> dict:
+    """Result for a script skipped because its output is current"""
+    print(f"  Skipped (cached): {item['script']}")
+    return {
+        "script": item["script"],
+        "success": True,
+        "status": "skipped (cached)"
+    }
+
+
+def write_log_record(log, record: dict) -> None:
+    """Append one compact JSON record to the run log and flush it"""
+    log.write(json.dumps(record, separators=(',', ':')) + "\n")
+    log.flush()
+
+
+def report_result(item: dict, result: dict) -> None:
+    """Print the outcome of one script"""
+    if "status" in result:
+        print(f"  ✓ Output current, {result['status']}: {item['output']}")
+    elif result["success"]:
+        output_path = OUTPUTS_DIR / item["output"]
+        if output_path.exists():
+            print(f"  ✓ Output generated: {item['output']}")
+        else:
+            print(f"  ⚠ Script succeeded but output not found")
+    else:
+        print(f"  ✗ FAILED: {result.get('error', 'See logs')}")
+
+
+def parse_args(argv=None):
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Run all GAP verification scripts")
+    parser.add_argument(
+        "--serial", action="store_true",
+        help="run scripts one at a time instead of concurrently"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="rerun every script even if its output is current"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Run all verification scripts"""
+    args = parse_args(argv)
+
     print("=" * 60)
     print("432 Doubly Stochastic Matrix Verification Suite")
     print("=" * 60)
 
     OUTPUTS_DIR.mkdir(exist_ok=True)
 
+    # Run log: one compact JSON record per line, written as scripts finish
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_path = OUTPUTS_DIR / f"verification_run_log_{timestamp}.jsonl"
+    summary_path = OUTPUTS_DIR / f"verification_run_summary_{timestamp}.json"
+
     results = []
-    success_count = 0
-
-    for item in SCRIPTS:
-        print(f"\n[{item['name']}]")
-        print(f"  Description: {item['description']}")
-
-        result = run_gap_script(item["script"])
-        results.append(result)
-
-        if result["success"]:
-            success_count += 1
-            output_path = OUTPUTS_DIR / item["output"]
-            if output_path.exists():
-                print(f"  ✓ Output generated: {item['output']}")
-            else:
-                print(f"  ⚠ Script succeeded but output not found")
+
+    with open(log_path, 'w', buffering=65536) as log:
+        write_log_record(log, {"timestamp": timestamp, "total_scripts": len(SCRIPTS), "force": args.force})
+
+        if args.serial:
+            for item in SCRIPTS:
+                print(f"\n[{item['name']}]")
+                print(f"  Description: {item['description']}")
+
+                if not args.force and output_is_current(item):
+                    result = cached_result(item)
+                else:
+                    clear_stamp(item)
+                    result = run_gap_script(item["script"], timestamp)
+                    stamp_if_generated(item, result)
+                results.append(result)
+                write_log_record(log, result)
+                report_result(item, result)
         else:
-            print(f"  ✗ FAILED: {result.get('error', 'See logs')}")
+            print(f"\nLaunching {len(SCRIPTS)} scripts concurrently...")
+            results = asyncio.run(run_all_concurrently(log, timestamp, args.force))
 
-    # Generate summary report
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    summary_path = OUTPUTS_DIR / f"verification_run_log_{timestamp}.json"
+            for item, result in zip(SCRIPTS, results):
+                print(f"\n[{item['name']}]")
+                print(f"  Description: {item['description']}")
+                report_result(item, result)
+
+    success_count = sum(1 for r in results if r["success"])
 
+    # Small pretty-printed summary alongside the streamed log
     summary = {
         "timestamp": timestamp,
+        "log_file": log_path.name,
         "total_scripts": len(SCRIPTS),
         "successful": success_count,
-        "failed": len(SCRIPTS) - success_count,
-        "results": results
+        "failed": len(SCRIPTS) - success_count
     }
 
     with open(summary_path, 'w') as f:
@@ -133,7 +352,8 @@ def main():
 
     print("\n" + "=" * 60)
     print(f"Summary: {success_count}/{len(SCRIPTS)} scripts succeeded")
-    print(f"Log saved: {summary_path}")
+    print(f"Log saved: {log_path}")
+    print(f"Summary saved: {summary_path}")
     print("=" * 60)
 
     return 0 if success_count == len(SCRIPTS) else 1
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# 432 Doubly Stochastic Matrices Over F₃
+# Paper: "Doubly Stochastic Matrices Over F₃: Binary Trace Stratification"
+# Repository: https://github.com/boonespacedog/ternary-constraint-432-element-group
+# Updated: 2026-10-14
+
+"""
+Shared fixtures: GL(3,F₃) is enumerated once per test session
+"""
+
+import pytest
+
+from gl3_f3 import enumerate_gl3_f3, packed_gl3_f3
+
+@pytest.fixture(scope="session")
+def gl3():
+    """All 11,232 GL(3,F₃) matrices as a read-only (11232, 3, 3) array"""
+    return enumerate_gl3_f3()
+
+@pytest.fixture(scope="session")
+def gl3_keys(gl3):
+    """Frozen set of GL(3,F₃) matrices as flattened tuples, parallel to gl3"""
+    return frozenset(tuple(M.flatten()) for M in gl3)
+
+@pytest.fixture(scope="session")
+def gl3_packed():
+    """GL(3,F₃) as a flat read-only uint32[11232] of packed codes, parallel to gl3"""
+    return packed_gl3_f3()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# 432 Doubly Stochastic Matrices Over F₃
+# Paper: "Doubly Stochastic Matrices Over F₃: Binary Trace Stratification"
+# Repository: https://github.com/boonespacedog/ternary-constraint-432-element-group
+# Updated: 2026-10-14
+
+"""
+Shared GL(3,F₃) enumeration helpers for the test suite
+"""
+
+import functools
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional: the kernels below then run as plain Python
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# x % 3 by table lookup for 0 <= x < 51: covers 3×3 mod-3 inner products and
+# row/column sums (<= 12) and cofactor determinants shifted by +24 (raw values
+# lie in [-24, 24]), without an integer division
+MOD3 = np.tile(np.array([0, 1, 2], dtype=np.int8), 17)
+
+# Bit offset of entry (i, j) when a matrix is packed 2 bits per entry
+PACK_SHIFTS = (2 * np.arange(9, dtype=np.uint32)).reshape(3, 3)
+
+def pack(M):
+    """Pack (..., 3, 3) matrices over F_3 into uint32 codes (2 bits per entry)"""
+    M = np.asarray(M).astype(np.uint32)
+    return (M << PACK_SHIFTS).sum(axis=(-2, -1), dtype=np.uint32)
+
+def pack_scalar(M):
+    """pack() for one 3×3 matrix with Python int arithmetic (no NumPy reduction)"""
+    a = np.asarray(M).ravel().tolist()
+    return (a[0] | a[1] << 2 | a[2] << 4 | a[3] << 6 | a[4] << 8 | a[5] << 10
+            | a[6] << 12 | a[7] << 14 | a[8] << 16)
+
+def unpack(code):
+    """Inverse of pack: uint32 code(s) -> (..., 3, 3) int8 matrices"""
+    code = np.asarray(code, dtype=np.uint32)[..., None, None]
+    return ((code >> PACK_SHIFTS) & 3).astype(np.int8)
+
+# Packed code of the 3×3 identity
+IDENTITY_CODE = (1 << 0) | (1 << 8) | (1 << 16)
+
+# Number of 3×3 matrices over F_3, an upper bound on any closure
+N_MATRICES = 3 ** 9
+
+def _dot_table():
+    """DOT[r, c] = (r · c) mod 3 for 3-trit vectors packed 2 bits per trit"""
+    trits = (np.arange(64)[:, None] >> (2 * np.arange(3))) & 3
+    return np.ascontiguousarray((trits @ trits.T) % 3, dtype=np.uint8)
+
+# Row-times-column lookup: a packed row of A is 6 contiguous bits, a column of B
+# is gathered into the same layout, so each output entry is one table load
+DOT = _dot_table()
+
+# ROW_SUM_MOD3[r] = (sum of the three trits of a packed 6-bit row) mod 3
+ROW_SUM_MOD3 = MOD3[((np.arange(64)[:, None] >> (2 * np.arange(3))) & 3).sum(axis=1)].astype(np.uint8)
+
+@njit(cache=True)
+def mul_packed(a, b):
+    """Product mod 3 of two packed matrices, returned packed"""
+    a = np.int64(a)
+    b = np.int64(b)
+    out = np.int64(0)
+    for j in range(3):
+        col = (((b >> (2 * j)) & 3)
+               | (((b >> (2 * j + 6)) & 3) << 2)
+               | (((b >> (2 * j + 12)) & 3) << 4))
+        for i in range(3):
+            row = (a >> (6 * i)) & 0x3F
+            out |= np.int64(DOT[row, col]) << (2 * (3 * i + j))
+    return np.uint32(out)
+
+@njit(cache=True)
+def mod3_small(x):
+    """x % 3 for 0 <= x < 9 as two conditional subtracts"""
+    return x - 3 * (x >= 3) - 3 * (x >= 6)
+
+@njit(cache=True)
+def conservation_packed(code):
+    """Row sums = 1 (mod 3) for a packed matrix (one table load per row)"""
+    code = np.int64(code)
+    return (ROW_SUM_MOD3[code & 0x3F] == 1
+            and ROW_SUM_MOD3[(code >> 6) & 0x3F] == 1
+            and ROW_SUM_MOD3[(code >> 12) & 0x3F] == 1)
+
+@njit(cache=True)
+def row_and_col_packed(code):
+    """Both row AND column sums = 1 (mod 3) for a packed matrix"""
+    if not conservation_packed(code):
+        return False
+    code = np.int64(code)
+    for j in range(3):
+        col = ((code >> (2 * j)) & 3) + ((code >> (2 * j + 6)) & 3) + ((code >> (2 * j + 12)) & 3)
+        if mod3_small(col) != 1:
+            return False
+    return True
+
+@njit(cache=True)
+def closure_packed(gens, max_size=N_MATRICES):
+    """
+    Closure of packed generators (plus identity) under multiplication mod 3.
+
+    Breadth-first search in which every element is right-multiplied by each
+    generator; for a finite set this reaches every product of generators.
+    Membership is a flat boolean table indexed by the 18-bit code. Stops
+    once max_size elements are found and returns exactly the first max_size.
+
+    Returns:
+        uint32 array of packed codes in discovery order
+    """
+    seen = np.zeros(1 << 18, dtype=np.bool_)
+    elems = np.empty(N_MATRICES, dtype=np.uint32)
+    seen[IDENTITY_CODE] = True
+    elems[0] = IDENTITY_CODE
+    n = 1
+    for g in gens:
+        if not seen[g]:
+            seen[g] = True
+            elems[n] = g
+            n += 1
+
+    head = 0
+    while head < n and n < max_size:
+        current = elems[head]
+        head += 1
+        for g in gens:
+            prod = mul_packed(current, g)
+            if not seen[prod]:
+                seen[prod] = True
+                elems[n] = prod
+                n += 1
+    return elems[:min(n, max_size)]
+
+@njit(parallel=True, cache=True)
+def scan_pairs(mul, pairs, identity, max_size, out_sizes, out_seen):
+    """
+    Closure size of every generator pair over a Cayley table, in parallel.
+
+    mul[i, j] is the id of element_i * element_j; pairs is an (n, 2) array of
+    generator ids. Each pair gets the same right-multiplication BFS as
+    closure_packed, stopping once the group reaches max_size, so
+    out_sizes[p] = min(|<pairs[p]>|, max_size). Row out_seen[p] (uint8, one
+    column per element) is left marking the elements found.
+    """
+    n = mul.shape[0]
+    for p in prange(len(pairs)):
+        seen = out_seen[p]
+        seen[:] = 0
+        elems = np.empty(n, dtype=np.int64)
+        seen[identity] = 1
+        elems[0] = identity
+        size = 1
+        for k in range(2):
+            g = pairs[p, k]
+            if not seen[g]:
+                seen[g] = 1
+                elems[size] = g
+                size += 1
+
+        head = 0
+        while head < size and size < max_size:
+            current = elems[head]
+            head += 1
+            for k in range(2):
+                prod = mul[current, pairs[p, k]]
+                if not seen[prod]:
+                    seen[prod] = 1
+                    elems[size] = prod
+                    size += 1
+        out_sizes[p] = min(size, max_size)
+
+def generate_closure(generators, max_size=None):
+    """
+    Closure of generators (plus identity) under multiplication mod 3.
+
+    Vectorized fixed-point iteration: each round multiplies the newly found
+    elements by the whole group on both sides in one einsum, packs the
+    products and keeps the unseen codes. Stops once a round adds nothing or
+    the group reaches max_size; the last round can overshoot, so the result
+    is then cut to the first max_size elements found.
+
+    Returns:
+        (G, codes): (n, 3, 3) int8 array and the parallel set of packed codes
+    """
+    gens = np.asarray(generators, dtype=np.int8).reshape(-1, 3, 3) % 3
+    start = np.concatenate([np.eye(3, dtype=np.int8)[None], gens])
+    known, first = np.unique(pack(start), return_index=True)
+    G = start[np.sort(first)]
+    frontier = G
+
+    while len(frontier) and (max_size is None or len(G) < max_size):
+        P = np.concatenate([
+            np.einsum('aij,bjk->abik', frontier, G).reshape(-1, 3, 3),
+            np.einsum('aij,bjk->abik', G, frontier).reshape(-1, 3, 3),
+        ])
+        P = MOD3[P]
+        new_codes = np.setdiff1d(pack(P), known)
+        frontier = unpack(new_codes)
+        G = np.concatenate([G, frontier])
+        known = np.union1d(known, new_codes)
+
+    if max_size is not None and len(G) > max_size:
+        G = G[:max_size]
+        known = pack(G)
+    return G, {int(c) for c in known}
+
+def conservation_mask(E):
+    """Row sums = 1 (mod 3), over a (N, 3, 3) stack"""
+    return np.all(MOD3[E.sum(axis=2)] == 1, axis=1)
+
+def row_and_col_mask(E):
+    """Both row AND column sums = 1 (mod 3), over a (N, 3, 3) stack"""
+    return conservation_mask(E) & np.all(MOD3[E.sum(axis=1)] == 1, axis=1)
+
+def det_mod3(E):
+    """Determinant mod 3 of a (..., 3, 3) stack with entries in {0,1,2} (cofactor expansion)"""
+    det = (E[..., 0, 0] * (E[..., 1, 1] * E[..., 2, 2] - E[..., 1, 2] * E[..., 2, 1])
+           - E[..., 0, 1] * (E[..., 1, 0] * E[..., 2, 2] - E[..., 1, 2] * E[..., 2, 0])
+           + E[..., 0, 2] * (E[..., 1, 0] * E[..., 2, 1] - E[..., 1, 1] * E[..., 2, 0]))
+    return MOD3[det + 24]
+
+def all_matrices_f3():
+    """
+    All 3^9 3×3 matrices over F_3 as a (19683, 3, 3) int8 array.
+
+    Built by base-3 expansion of 0..3^9-1, last entry varying fastest (the
+    same order as itertools.product([0,1,2], repeat=9)).
+    """
+    q = np.arange(N_MATRICES, dtype=np.int32)
+    E = np.empty((N_MATRICES, 9), dtype=np.int8)
+    for k in range(8, -1, -1):
+        E[:, k] = q % 3
+        q //= 3
+    return E.reshape(-1, 3, 3)
+
+@functools.lru_cache(maxsize=1)
+def enumerate_gl3_f3():
+    """All GL(3,F_3) matrices as a read-only (11232, 3, 3) int8 array"""
+    E = all_matrices_f3()
+    G = E[det_mod3(E) != 0]
+    G.flags.writeable = False
+    return G
+
+@functools.lru_cache(maxsize=1)
+def packed_gl3_f3():
+    """All GL(3,F_3) matrices as a flat read-only uint32[11232] of packed codes"""
+    codes = pack(enumerate_gl3_f3())
+    codes.flags.writeable = False
+    return codes
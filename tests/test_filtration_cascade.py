@@ -11,40 +11,31 @@ Oracle values from DEFINITIVE_RESULTS_OCT30.md
 
 import pytest
 import numpy as np
-import itertools
 
-def generate_gl3_f3():
-    """Generate all GL(3,F_3) matrices"""
-    matrices = []
-    for entries in itertools.product([0,1,2], repeat=9):
-        M = np.array(entries).reshape(3, 3)
-        if int(np.round(np.linalg.det(M))) % 3 != 0:
-            matrices.append(M)
-    return matrices
+from gl3_f3 import (MOD3, conservation_mask, conservation_packed, pack_scalar,
+                    row_and_col_mask, row_and_col_packed)
 
 def check_conservation(M):
-    """Row sums = 1 (mod 3)"""
-    return all(sum(M[i,:]) % 3 == 1 for i in range(3))
+    """Row sums = 1 (mod 3), for a single 3×3 ndarray or its packed code"""
+    code = pack_scalar(M) if isinstance(M, np.ndarray) else int(M)
+    return bool(conservation_packed(code))
+
+# Basis of H = ker([1,1,1]) over F_3, one vector per row
+H_BASIS = np.array([[1,2,0], [0,1,2]])
+
+def normalizes_h_mask(E):
+    """Batch form of check_normalizes_h over a (..., 3, 3) stack"""
+    # H is a subspace, so M preserves it iff it maps both basis vectors into it
+    return np.all(MOD3[(E @ H_BASIS.T).sum(axis=-2)] == 0, axis=-1)
 
 def check_normalizes_h(M):
     """Preserves kernel H = ker([1,1,1])"""
-    H_basis = [np.array([1,2,0]), np.array([0,1,2])]
-    for v in H_basis:
-        if sum((M @ v) % 3) % 3 != 0:
-            return False
-    for a in [0,1,2]:
-        for b in [0,1,2]:
-            if a == 0 and b == 0:
-                continue
-            v = (a * H_basis[0] + b * H_basis[1]) % 3
-            if sum((M @ v) % 3) % 3 != 0:
-                return False
-    return True
+    return bool(normalizes_h_mask(M))
 
 def check_row_and_col(M):
-    """Both row AND column sums = 1 (mod 3)"""
-    return (all(sum(M[i,:]) % 3 == 1 for i in range(3)) and
-            all(sum(M[:,j]) % 3 == 1 for j in range(3)))
+    """Both row AND column sums = 1 (mod 3), for a single 3×3 ndarray or its packed code"""
+    code = pack_scalar(M) if isinstance(M, np.ndarray) else int(M)
+    return bool(row_and_col_packed(code))
 
 class TestFiltrationCascade:
     """
@@ -52,16 +43,15 @@ class TestFiltrationCascade:
     Source: DEFINITIVE_RESULTS_OCT30.md
     """
 
-    def test_gl3_f3_total_size(self):
+    def test_gl3_f3_total_size(self, gl3, gl3_keys):
         """Oracle: |GL(3,F₃)| = 11,232"""
-        matrices = generate_gl3_f3()
-        assert len(matrices) == 11232, f"Expected 11232, got {len(matrices)}"
+        assert len(gl3) == 11232, f"Expected 11232, got {len(gl3)}"
+        assert len(gl3_keys) == 11232, "GL(3,F₃) enumeration contains duplicates"
 
-    def test_conservation_only_yields_432(self):
+    def test_conservation_only_yields_432(self, gl3):
         """Oracle: 432 operators with conservation only (computational enumeration)"""
         """Oracle: 432 operators with conservation only"""
-        matrices = generate_gl3_f3()
-        conservation_ops = [M for M in matrices if check_conservation(M)]
+        conservation_ops = gl3[conservation_mask(gl3)]
         # Oracle expectation based on computational enumeration
         actual_count = len(conservation_ops)
         print(f"Conservation operators found: {actual_count}")
@@ -69,11 +59,10 @@ class TestFiltrationCascade:
         assert actual_count == 432, \
             f"Expected 432 with conservation, got {len(conservation_ops)}"
 
-    def test_three_constraints_yield_54(self):
+    def test_three_constraints_yield_54(self, gl3):
         """Oracle: 54 operators with doubly stochastic constraints"""
         """Oracle: 54 operators with all 3 constraints (doubly stochastic)"""
-        matrices = generate_gl3_f3()
-        three_constraint_ops = [M for M in matrices if check_row_and_col(M)]
+        three_constraint_ops = gl3[row_and_col_mask(gl3)]
         # Oracle expectation: Doubly stochastic subset
         actual_count = len(three_constraint_ops)
         print(f"Doubly stochastic operators found: {actual_count}")
@@ -81,5 +70,15 @@ class TestFiltrationCascade:
         assert actual_count == 54, \
             f"Expected 54 with 3 constraints, got {len(three_constraint_ops)}"
 
+    def test_single_matrix_checks_match_masks(self, gl3, gl3_packed):
+        """Scalar diagnostics agree with the batch masks on a sample of GL(3,F₃)"""
+        sample = gl3[::37]
+        codes = gl3_packed[::37]
+        assert [check_conservation(M) for M in sample] == conservation_mask(sample).tolist()
+        assert [check_conservation(c) for c in codes] == conservation_mask(sample).tolist()
+        assert [check_row_and_col(M) for M in sample] == row_and_col_mask(sample).tolist()
+        assert [check_row_and_col(c) for c in codes] == row_and_col_mask(sample).tolist()
+        assert [check_normalizes_h(M) for M in sample] == normalizes_h_mask(sample).tolist()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
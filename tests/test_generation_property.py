@@ -17,46 +17,18 @@ import random
 from pathlib import Path
 from itertools import combinations
 
+from gl3_f3 import HAVE_NUMBA, MOD3, closure_packed, generate_closure, pack, unpack
+
 def matrix_multiply_mod3(A, B):
     """Matrix multiplication modulo 3"""
-    return (A @ B) % 3
+    return MOD3[A @ B]
 
 def generate_group_from_pair(M1, M2, max_size=500):
-    """Generate group from two matrices"""
-    group = set()
-    I = np.eye(3, dtype=int)
-
-    # Start with identity and generators
-    group.add(tuple(I.flatten()))
-    group.add(tuple(M1.flatten()))
-    group.add(tuple(M2.flatten()))
-
-    # Keep track of elements to process
-    to_process = [M1, M2]
-    processed = set()
-
-    while to_process and len(group) < max_size:
-        current = to_process.pop(0)
-        current_tuple = tuple(current.flatten())
-
-        if current_tuple in processed:
-            continue
-        processed.add(current_tuple)
-
-        # Generate products with all existing elements
-        for elem_tuple in list(group):
-            elem = np.array(elem_tuple).reshape(3, 3)
-
-            # Try both orders of multiplication
-            prod1 = matrix_multiply_mod3(current, elem)
-            prod2 = matrix_multiply_mod3(elem, current)
-
-            for prod in [prod1, prod2]:
-                prod_tuple = tuple(prod.flatten())
-                if prod_tuple not in group:
-                    group.add(prod_tuple)
-                    to_process.append(prod)
-
+    """Generate group from two matrices (returns set of packed uint32 codes)"""
+    if HAVE_NUMBA:
+        codes = closure_packed(pack(np.array([M1, M2])), max_size)
+        return {int(c) for c in codes}
+    _, group = generate_closure([M1, M2], max_size=max_size)
     return group
 
 class TestGenerationProperty:
@@ -140,7 +112,7 @@ class TestGenerationProperty:
         M2 = operators_108[1]
 
         group = generate_group_from_pair(M1, M2)
-        group_matrices = [np.array(t).reshape(3,3) for t in group]
+        group_matrices = [unpack(code) for code in group]
 
         # Sample test: verify closure for random pairs
         random.seed(42)
@@ -151,9 +123,7 @@ class TestGenerationProperty:
             B = random.choice(group_matrices)
 
             product = matrix_multiply_mod3(A, B)
-            product_tuple = tuple(product.flatten())
-
-            assert product_tuple in group, \
+            assert int(pack(product)) in group, \
                 "Group not closed under multiplication"
 
     def test_save_generation_results(self, operators_108):
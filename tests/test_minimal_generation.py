@@ -10,83 +10,289 @@ Find the minimal number of operators from the 108-set needed to generate AGL(2,3
 Based on mathematical formalism in MINIMAL_GENERATING_SET_FORMALISM.md
 """
 
+import pytest
 import numpy as np
 import json
 import itertools
 import random
 from pathlib import Path
-from typing import List, Set, Tuple, Dict
+from typing import List, Tuple, Dict
 import time
+from collections import deque
+
+from gl3_f3 import HAVE_NUMBA, MOD3, all_matrices_f3, generate_closure, pack, scan_pairs
+
+# Bitsliced F_3 matrices: entry (i, j) is bit 3i+j of two 9-bit planes,
+# lo = "entry is nonzero" and hi = "entry is 2" (0 = (0,0), 1 = (1,0), 2 = (1,1))
+BS_MASK = 0b111111111
+BS_COL0 = 0b001001001  # entries (0,0), (1,0), (2,0)
+BS_BITS = 1 << np.arange(9)
+
+def bitslice(M: np.ndarray) -> Tuple[int, int]:
+    """Encode a 3×3 matrix over F_3 as (lo, hi) bit planes."""
+    entries = np.asarray(M, dtype=np.int64).reshape(9) % 3
+    return int(BS_BITS[entries != 0].sum()), int(BS_BITS[entries == 2].sum())
+
+def unbitslice(lo: int, hi: int) -> np.ndarray:
+    """Decode (lo, hi) bit planes back to a 3×3 int matrix."""
+    lo_bits = (lo >> np.arange(9)) & 1
+    hi_bits = (hi >> np.arange(9)) & 1
+    return (lo_bits + hi_bits).reshape(3, 3)
+
+def _bs_add(a_lo: int, a_hi: int, b_lo: int, b_hi: int) -> Tuple[int, int]:
+    """Entrywise sum mod 3 of two bitsliced matrices."""
+    a1, b1 = a_lo ^ a_hi, b_lo ^ b_hi  # "entry is 1" planes
+    a0, b0 = ~a_lo & BS_MASK, ~b_lo & BS_MASK  # "entry is 0" planes
+    two = (a_hi & b0) | (a0 & b_hi) | (a1 & b1)
+    one = (a1 & b0) | (a0 & b1) | (a_hi & b_hi)
+    return one | two, two
+
+def _bs_mul(a_lo: int, a_hi: int, b_lo: int, b_hi: int) -> Tuple[int, int]:
+    """
+    Matrix product mod 3 of two bitsliced matrices.
+
+    For each k, column k of A is spread along its rows and row k of B down
+    its columns, so one AND (nonzero) and one XOR (sign) form all nine terms
+    A[i,k] * B[k,j] at once; the three terms are then summed with _bs_add.
+    """
+    c_lo = c_hi = 0
+    for k in range(3):
+        ak_lo = ((a_lo >> k) & BS_COL0) * 0b111
+        ak_hi = ((a_hi >> k) & BS_COL0) * 0b111
+        bk_lo = ((b_lo >> (3 * k)) & 0b111) * BS_COL0
+        bk_hi = ((b_hi >> (3 * k)) & 0b111) * BS_COL0
+        t_lo = ak_lo & bk_lo
+        t_hi = t_lo & (ak_hi ^ bk_hi)
+        c_lo, c_hi = _bs_add(c_lo, c_hi, t_lo, t_hi)
+    return c_lo, c_hi
+
+# The 6 known generators from E46, used when no operator file is found
+E46_GENERATORS = np.array([
+    [[0,1,0], [0,2,2], [1,0,0]],
+    [[0,1,0], [0,2,2], [1,2,1]],
+    [[0,1,0], [2,0,2], [1,0,0]],
+    [[1,0,0], [1,2,1], [0,1,0]],
+    [[1,0,0], [2,1,1], [0,1,0]],
+    [[2,1,1], [2,0,2], [1,0,0]],
+], dtype=np.int8)
+
+class LazyProductTable:
+    """
+    Stand-in for the Cayley table when the group is too large to tabulate.
+
+    table[i, j] multiplies the bitsliced elements i and j on demand and
+    returns the id of the product, handing out new ids in discovery order.
+    """
+
+    def __init__(self):
+        self.codes = []  # id -> (lo, hi)
+        self.ids = {}  # (lo, hi) -> id
+
+    def intern(self, code: Tuple[int, int]) -> int:
+        """Id of a bitsliced element, assigning the next id if it is new."""
+        element_id = self.ids.get(code)
+        if element_id is None:
+            element_id = self.ids[code] = len(self.codes)
+            self.codes.append(code)
+        return element_id
+
+    def __getitem__(self, key: Tuple[int, int]) -> int:
+        i, j = key
+        return self.intern(_bs_mul(*self.codes[i], *self.codes[j]))
 
 class MinimalGenerationInvestigator:
     """
     Investigates minimal generating sets from the 108-operator constraint set.
     """
 
-    def __init__(self, operators_108: List[np.ndarray]):
-        """Initialize with the 108-operator set."""
-        self.operators = operators_108
-        self.n_ops = len(operators_108)
+    # Largest group tabulated in full (a uint16 table of at most 2 MB); bigger
+    # groups multiply bitsliced matrices on demand instead
+    MAX_CAYLEY_ORDER = 1024
+
+    def __init__(self, operators_108: np.ndarray):
+        """Initialize with the 108-operator set, as an (n, 3, 3) array or list of matrices."""
+        self.operators = np.asarray(operators_108, dtype=np.int8).reshape(-1, 3, 3)
+        self.n_ops = len(self.operators)
         self.identity = np.eye(3, dtype=int)
+        self.build_cayley_table()
+        # (frozenset of generator ids, max_size) -> closure bitmask
+        self.closure_cache = {}
+        # (operator index i < j, max_size) -> uint8 seen vector of <op_i, op_j>
+        self.pair_seen_cache = {}
 
-    def matrix_multiply_mod3(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
-        """Matrix multiplication modulo 3."""
-        return (A @ B) % 3
+    def build_cayley_table(self):
+        """
+        Enumerate the group generated by all operators and tabulate it.
 
-    def matrix_to_tuple(self, M: np.ndarray) -> tuple:
-        """Convert matrix to hashable tuple."""
-        return tuple(M.flatten())
+        Every element gets an integer id (the identity is id 0) and
+        mul[i, j] is the id of element_i @ element_j, so closures below are
+        pure table lookups. op_ids[k] is the id of operator k. If the group
+        has more than MAX_CAYLEY_ORDER elements, mul is a LazyProductTable.
+        """
+        elements, _ = generate_closure(self.operators, max_size=self.MAX_CAYLEY_ORDER + 1)
+        if len(elements) > self.MAX_CAYLEY_ORDER:
+            self.build_lazy_table()
+            return
+
+        codes = pack(elements)
+
+        id_of = np.full(1 << 18, -1, dtype=np.int32)
+        id_of[codes] = np.arange(len(elements))
+
+        products = MOD3[np.einsum('aij,bjk->abik', elements, elements)]
+        self.group_order = len(elements)
+        self.identity_id = int(id_of[pack(self.identity)])
+        self.mul = id_of[pack(products)].astype(np.uint16)
+        self.op_ids = [int(i) for i in id_of[pack(self.operators)]]
+        # Bitmask of the whole tabulated group: no closure can grow past it
+        self.full_mask = (1 << self.group_order) - 1
+
+    def build_lazy_table(self):
+        """Fallback for large groups: ids are interned as products are found."""
+        self.mul = LazyProductTable()
+        self.group_order = None
+        self.identity_id = self.mul.intern(bitslice(self.identity))
+        self.op_ids = [self.mul.intern(bitslice(M)) for M in self.operators]
+        # Group order unknown: closures only stop at max_size or when complete
+        self.full_mask = None
+
+    def order(self, g_id: int) -> int:
+        """Order of element g_id: smallest n with g^n = identity, by table lookup."""
+        mul = self.mul
+        current = g_id
+        n = 1
+        while current != self.identity_id:
+            current = int(mul[current, g_id])
+            n += 1
+        return n
+
+    def cyclic_mask(self, g_id: int) -> int:
+        """Bitmask of the cyclic subgroup <g>, by walking powers of g."""
+        mul = self.mul
+        mask = 1 << g_id
+        current = g_id
+        while current != self.identity_id:
+            current = int(mul[current, g_id])
+            mask |= 1 << current
+        return mask
+
+    def generate_group(self, generator_ids: List[int], max_size: int = 500) -> int:
+        """
+        Generate group from list of generator ids using breadth-first search
+        over the Cayley table. Returns the group as a bitmask over element ids
+        (bit k set iff element k is in the group).
+
+        Results are memoized on the generator set, so overlapping subsets
+        (e.g. the leave-one-out checks in verify_minimality) are closed once.
+        """
+        key = (frozenset(generator_ids), max_size)
+        mask = self.closure_cache.get(key)
+        if mask is None:
+            mask = self.closure_cache[key] = self._closure(generator_ids, max_size)
+        return mask
 
-    def compute_matrix_order(self, M: np.ndarray, max_order: int = 20) -> int:
-        """Compute the order of a matrix in GL(3, F_3)."""
-        current = M.copy()
-        for n in range(1, max_order + 1):
-            if np.array_equal(current % 3, self.identity):
-                return n
-            current = self.matrix_multiply_mod3(current, M)
-        return -1  # Order exceeds max_order
+    def _closure(self, generator_ids: List[int], max_size: int) -> int:
+        """Uncached BFS behind generate_group."""
+        if not isinstance(self.mul, LazyProductTable):
+            return self._closure_vectorized(generator_ids, max_size)
 
-    def generate_group(self, generators: List[np.ndarray], max_size: int = 500) -> Set[tuple]:
+        mul = self.mul
+        seen = 1 << self.identity_id
+        elements = [self.identity_id]  # discovered ids in order, alongside the seen bitmask
+
+        # Add generators
+        for gen in generator_ids:
+            if not (seen >> gen) & 1:
+                seen |= 1 << gen
+                elements.append(gen)
+
+        if len(elements) >= max_size:
+            return seen
+
+        # BFS to generate all elements; an empty queue means the closure is complete
+        to_process = deque(generator_ids)
+        processed = 0
+
+        while to_process:
+            current = to_process.popleft()
+
+            if (processed >> current) & 1:
+                continue
+            processed |= 1 << current
+
+            # Generate products with all existing elements. One order suffices:
+            # the generators are present from the start, so every processed
+            # element is multiplied on the right by each of them and the final
+            # set is closed.
+            for k in range(len(elements)):
+                prod = int(mul[current, elements[k]])
+                if not (seen >> prod) & 1:
+                    seen |= 1 << prod
+                    elements.append(prod)
+                    if len(elements) >= max_size or seen == self.full_mask:
+                        return seen  # the caller only asks whether max_size is reached
+                    to_process.append(prod)
+
+        return seen
+
+    def _closure_vectorized(self, generator_ids: List[int], max_size: int) -> int:
         """
-        Generate group from list of generators using breadth-first search.
-        Returns set of matrix tuples.
+        The same BFS on the uint16 table, one NumPy step per popped element:
+        mul[current, elements] forms every product at once and the unseen
+        ones are scattered into a uint8 seen vector.
         """
-        group = set()
-        group.add(self.matrix_to_tuple(self.identity))
+        mul = self.mul
+        seen = np.zeros(self.group_order, dtype=np.uint8)
+        elements = np.empty(self.group_order, dtype=np.int64)
+        seen[self.identity_id] = 1
+        elements[0] = self.identity_id
+        n = 1
 
         # Add generators
-        for gen in generators:
-            group.add(self.matrix_to_tuple(gen))
+        for gen in generator_ids:
+            if not seen[gen]:
+                seen[gen] = 1
+                elements[n] = gen
+                n += 1
 
-        # BFS to generate all elements
-        to_process = list(generators)
-        processed = set()
+        limit = min(max_size, self.group_order)
+        if n >= limit:
+            return self.seen_to_mask(seen)
 
-        while to_process and len(group) < max_size:
-            current = to_process.pop(0)
-            current_tuple = self.matrix_to_tuple(current)
+        to_process = deque(generator_ids)
+        processed = np.zeros(self.group_order, dtype=np.uint8)
 
-            if current_tuple in processed:
+        while to_process:
+            current = to_process.popleft()
+
+            if processed[current]:
                 continue
-            processed.add(current_tuple)
+            processed[current] = 1
+
+            # A table row is a permutation, so these products are distinct
+            prods = mul[current, elements[:n]]
+            new = prods[seen[prods] == 0]
+            if n + len(new) >= limit:
+                seen[new[:limit - n]] = 1
+                return self.seen_to_mask(seen)  # the caller only asks whether max_size is reached
 
-            # Generate products with all existing elements
-            for elem_tuple in list(group):
-                elem = np.array(elem_tuple).reshape(3, 3)
+            seen[new] = 1
+            elements[n:n + len(new)] = new
+            n += len(new)
+            to_process.extend(new.tolist())
 
-                # Both orders of multiplication
-                prod1 = self.matrix_multiply_mod3(current, elem)
-                prod2 = self.matrix_multiply_mod3(elem, current)
+        return self.seen_to_mask(seen)
 
-                for prod in [prod1, prod2]:
-                    prod_tuple = self.matrix_to_tuple(prod)
-                    if prod_tuple not in group:
-                        group.add(prod_tuple)
-                        if len(group) >= max_size:
-                            break
-                        to_process.append(prod)
+    @staticmethod
+    def seen_to_mask(seen: np.ndarray) -> int:
+        """Bitmask with bit k set iff seen[k] is nonzero."""
+        return int.from_bytes(np.packbits(seen, bitorder='little').tobytes(), 'little')
+
+    @staticmethod
+    def group_size(mask: int) -> int:
+        """Number of elements in a group bitmask (popcount)."""
+        return bin(mask).count('1')
 
-        return group
 
     def test_single_generators(self) -> Dict:
         """Test if any single operator generates the full group."""
@@ -100,8 +306,9 @@ class MinimalGenerationInvestigator:
         }
 
         for i in range(self.n_ops):
-            group = self.generate_group([self.operators[i]], max_size=432)
-            size = len(group)
+            # <g> is cyclic, so its size is the order of g
+            order = self.order(self.op_ids[i])
+            size = int(order)
 
             if size == 432:
                 results['generating_indices'].append(i)
@@ -109,7 +316,6 @@ class MinimalGenerationInvestigator:
             results['max_subgroup_size'] = max(results['max_subgroup_size'], size)
 
             # Track order of the generator
-            order = self.compute_matrix_order(self.operators[i])
             if order not in results['order_distribution']:
                 results['order_distribution'][order] = 0
             results['order_distribution'][order] += 1
@@ -147,9 +353,10 @@ class MinimalGenerationInvestigator:
             'size_distribution': {}
         }
 
+        pair_sizes = self.pair_closure_sizes(pairs_to_test, max_size=432)
+
         for idx, (i, j) in enumerate(pairs_to_test):
-            group = self.generate_group([self.operators[i], self.operators[j]], max_size=432)
-            size = len(group)
+            size = int(pair_sizes[idx])
 
             if size == 432:
                 results['generating_pairs'].append([i, j])
@@ -166,31 +373,160 @@ class MinimalGenerationInvestigator:
 
         # Calculate statistics
         results['proportion_generating'] = len(results['generating_pairs']) / len(pairs_to_test)
-        results['average_subgroup_size'] = np.mean(results['subgroup_sizes'])
+        results['average_subgroup_size'] = float(np.mean(results['subgroup_sizes']))
 
         print(f"  Pairs generating 432: {len(results['generating_pairs'])} out of {len(pairs_to_test)}")
         print(f"  Proportion: {results['proportion_generating']:.2%}")
 
         return results
 
+    def pair_closure_sizes(self, pairs: List[Tuple[int, int]], max_size: int = 432) -> List[int]:
+        """
+        Closure size (capped at max_size) of each operator-index pair.
+
+        Commuting pairs are sized exactly without a BFS: <g, h> = <g><h>, so
+        |<g, h>| = |g| |h| / |<g> ∩ <h>|. The rest use the parallel Numba
+        kernel when available, else pair_seen (generate_group on the lazy
+        table); either way their closures are kept for triple_closure_size.
+        """
+        mul = self.mul
+        sizes = [0] * len(pairs)
+        cyclic = {}
+        to_close = []
+
+        for idx, (i, j) in enumerate(pairs):
+            g, h = self.op_ids[i], self.op_ids[j]
+            if int(mul[g, h]) != int(mul[h, g]):
+                to_close.append(idx)
+                continue
+            for x in (g, h):
+                if x not in cyclic:
+                    cyclic[x] = self.cyclic_mask(x)
+            size = (self.group_size(cyclic[g]) * self.group_size(cyclic[h])
+                    // self.group_size(cyclic[g] & cyclic[h]))
+            sizes[idx] = min(size, max_size)
+
+        if not to_close:
+            return sizes
+
+        if isinstance(mul, LazyProductTable):
+            for idx in to_close:
+                i, j = pairs[idx]
+                group = self.generate_group([self.op_ids[i], self.op_ids[j]], max_size=max_size)
+                sizes[idx] = self.group_size(group)
+            return sizes
+
+        if not HAVE_NUMBA:
+            for idx in to_close:
+                sizes[idx] = int(np.count_nonzero(self.pair_seen(*pairs[idx], max_size=max_size)))
+            return sizes
+
+        op_ids = np.asarray(self.op_ids, dtype=np.int64)
+        pair_ids = op_ids[np.asarray([pairs[idx] for idx in to_close], dtype=np.int64)]
+        scanned = np.empty(len(pair_ids), dtype=np.int64)
+        seen = np.empty((len(pair_ids), self.group_order), dtype=np.uint8)
+        scan_pairs(mul, pair_ids, self.identity_id, max_size, scanned, seen)
+        for row, (idx, size) in enumerate(zip(to_close, scanned.tolist())):
+            sizes[idx] = size
+            i, j = sorted(pairs[idx])
+            self.pair_seen_cache[(i, j, max_size)] = seen[row]
+        return sizes
+
+    def pair_seen(self, i: int, j: int, max_size: int = 432) -> np.ndarray:
+        """
+        uint8 seen vector of <op_i, op_j> (capped at max_size), closed with
+        grow_closure and cached; scan_pairs fills the same cache.
+        """
+        i, j = sorted((i, j))
+        key = (i, j, max_size)
+        seen = self.pair_seen_cache.get(key)
+        if seen is None:
+            generators = np.array([self.op_ids[i], self.op_ids[j]])
+            seen = np.zeros(self.group_order, dtype=np.uint8)
+            seen[self.identity_id] = 1
+            seen[generators] = 1
+            prods = self.mul[generators[:, None], generators].ravel()
+            self.grow_closure(seen, prods, generators, max_size)
+            self.pair_seen_cache[key] = seen
+        return seen
+
+    def grow_closure(self, seen: np.ndarray, prods: np.ndarray, generators: np.ndarray,
+                     max_size: int) -> int:
+        """
+        Vectorized right-multiplication BFS on the uint16 table.
+
+        seen marks a set already closed under right multiplication by the
+        generators except for the products in prods; each round marks the
+        unseen products and multiplies them by every generator. Stops at
+        max_size marked elements. Returns the final size.
+        """
+        mul = self.mul
+        size = int(np.count_nonzero(seen))
+        while True:
+            new = np.unique(prods[seen[prods] == 0])
+            if not len(new):
+                return size
+            if size + len(new) >= max_size:
+                seen[new[:max_size - size]] = 1
+                return max_size
+            size += len(new)
+            seen[new] = 1
+            prods = mul[new[:, None], generators].ravel()
+
+    def triple_closure_size(self, triple: Tuple[int, int, int], max_size: int = 432) -> int:
+        """
+        |<op_a, op_b, op_c>| (capped at max_size), grown from the union of
+        whichever pair closures test_pairs already cached.
+
+        Each pair closure is a subgroup, so it is already closed under right
+        multiplication by its own two generators; only its products with the
+        third generator can be new. The identity and generators are marked
+        with all their products queued, and grow_closure right-multiplies
+        every newly found element by all three, which closes the set as in
+        closure_packed.
+        """
+        mul = self.mul
+        a, b, c = triple
+        generators = np.array([self.op_ids[a], self.op_ids[b], self.op_ids[c]])
+        seen = np.zeros(self.group_order, dtype=np.uint8)
+        frontier = [mul[generators[:, None], generators].ravel()]
+        for (i, j), k in (((a, b), c), ((a, c), b), ((b, c), a)):
+            pair_seen = self.pair_seen_cache.get((i, j, max_size))
+            if pair_seen is None:
+                continue
+            members = np.flatnonzero(pair_seen)
+            if len(members) >= max_size:
+                return max_size
+            seen |= pair_seen
+            frontier.append(mul[members, self.op_ids[k]])
+
+        seen[self.identity_id] = 1
+        seen[generators] = 1
+        return self.grow_closure(seen, np.concatenate(frontier), generators, max_size)
+
     def test_triples(self, sample_size: int = 1000) -> Dict:
         """Test random sample of triples."""
         total_triples = self.n_ops * (self.n_ops - 1) * (self.n_ops - 2) // 6
 
+        sample_size = min(sample_size, total_triples)
         print(f"Testing {sample_size} random triples out of {total_triples}...")
 
-        all_triples = itertools.combinations(range(self.n_ops), 3)
         random.seed(42)
-        # Convert to list for sampling (memory intensive for large sets)
-        if sample_size < 10000:
-            triples_to_test = []
-            for _ in range(sample_size):
-                # Generate random triple
-                triple = sorted(random.sample(range(self.n_ops), 3))
-                triples_to_test.append(triple)
+        if 2 * sample_size > total_triples:
+            # Dense sample: enumerate and shuffle, rejection would mostly redraw
+            triples_to_test = list(itertools.combinations(range(self.n_ops), 3))
+            random.shuffle(triples_to_test)
+            triples_to_test = triples_to_test[:sample_size]
         else:
-            # For larger samples, might need streaming approach
-            triples_to_test = random.sample(list(itertools.combinations(range(self.n_ops), 3)), sample_size)
+            # Sparse sample: draw random triples, keeping each distinct one once,
+            # without materializing all C(n,3) combinations
+            triples_to_test = []
+            drawn = set()
+            while len(triples_to_test) < sample_size:
+                triple = tuple(sorted(random.sample(range(self.n_ops), 3)))
+                if triple not in drawn:
+                    drawn.add(triple)
+                    triples_to_test.append(triple)
 
         results = {
             'k': 3,
@@ -202,9 +538,11 @@ class MinimalGenerationInvestigator:
         }
 
         for idx, triple in enumerate(triples_to_test):
-            generators = [self.operators[i] for i in triple]
-            group = self.generate_group(generators, max_size=432)
-            size = len(group)
+            if isinstance(self.mul, LazyProductTable):
+                group = self.generate_group([self.op_ids[i] for i in triple], max_size=432)
+                size = self.group_size(group)
+            else:
+                size = self.triple_closure_size(triple, max_size=432)
 
             if size == 432:
                 results['generating_triples'].append(list(triple))
@@ -221,7 +559,7 @@ class MinimalGenerationInvestigator:
 
         # Calculate statistics
         results['proportion_generating'] = len(results['generating_triples']) / len(triples_to_test)
-        results['average_subgroup_size'] = np.mean(results['subgroup_sizes'])
+        results['average_subgroup_size'] = float(np.mean(results['subgroup_sizes']))
 
         print(f"  Triples generating 432: {len(results['generating_triples'])} out of {len(triples_to_test)}")
         print(f"  Proportion: {results['proportion_generating']:.2%}")
@@ -237,19 +575,19 @@ class MinimalGenerationInvestigator:
         if k == 1:
             return True  # Single generator is minimal by definition
 
-        full_generators = [self.operators[i] for i in generating_tuple]
+        full_generators = [self.op_ids[i] for i in generating_tuple]
         full_group = self.generate_group(full_generators, max_size=432)
 
-        if len(full_group) != 432:
+        if self.group_size(full_group) != 432:
             return False  # Not even a generating set
 
         # Check each subset with one generator removed
         for i in range(k):
             reduced_indices = generating_tuple[:i] + generating_tuple[i+1:]
-            reduced_generators = [self.operators[j] for j in reduced_indices]
+            reduced_generators = [self.op_ids[j] for j in reduced_indices]
             reduced_group = self.generate_group(reduced_generators, max_size=432)
 
-            if len(reduced_group) == 432:
+            if self.group_size(reduced_group) == 432:
                 return False  # Not minimal, can remove generator i
 
         return True
@@ -319,8 +657,8 @@ class MinimalGenerationInvestigator:
         return results
 
 
-def load_operators_108() -> List[np.ndarray]:
-    """Load the 108 operators from file."""
+def load_operators_108() -> np.ndarray:
+    """Load the 108 operators from file as an (n, 3, 3) int8 array."""
     # Try multiple possible locations
     possible_paths = [
         Path("/Users/mac/Desktop/egg-paper/ternary-constraint-432-element-group/archive/old_outputs/paper1_outputs_oct/conservation_nonannihilation_108_operators.csv"),
@@ -332,32 +670,101 @@ def load_operators_108() -> List[np.ndarray]:
     for csv_path in possible_paths:
         if csv_path.exists():
             print(f"Loading operators from {csv_path}")
-            operators = []
-            with open(csv_path, 'r') as f:
-                lines = f.readlines()
-                for line in lines[1:]:  # Skip header
-                    parts = line.strip().split(',')
-                    if len(parts) >= 10:
-                        matrix = np.array([
-                            [int(parts[1]), int(parts[2]), int(parts[3])],
-                            [int(parts[4]), int(parts[5]), int(parts[6])],
-                            [int(parts[7]), int(parts[8]), int(parts[9])]
-                        ])
-                        operators.append(matrix)
+            # Columns: index, then the nine entries in row-major order
+            operators = np.loadtxt(csv_path, delimiter=',', skiprows=1, usecols=range(1, 10),
+                                   dtype=np.int8, ndmin=2).reshape(-1, 3, 3)
 
             print(f"Loaded {len(operators)} operators")
             return operators
 
     # If no file found, use the known 6 generators from E46
     print("Warning: Using only 6 known generators from E46")
-    return [
-        np.array([[0,1,0], [0,2,2], [1,0,0]]),
-        np.array([[0,1,0], [0,2,2], [1,2,1]]),
-        np.array([[0,1,0], [2,0,2], [1,0,0]]),
-        np.array([[1,0,0], [1,2,1], [0,1,0]]),
-        np.array([[1,0,0], [2,1,1], [0,1,0]]),
-        np.array([[2,1,1], [2,0,2], [1,0,0]]),
-    ]
+    return E46_GENERATORS.copy()
+
+
+@pytest.fixture(scope="class")
+def investigator():
+    """Investigator over the 6 built-in E46 generators (Cayley-table path)"""
+    return MinimalGenerationInvestigator(E46_GENERATORS)
+
+class TestMinimalGenerationInvestigator:
+    """
+    Cayley-table closures agree with direct matrix closure on the E46 generators
+    """
+
+    def test_cayley_table(self, investigator):
+        """The 6 generators close to AGL(2,3): a 432×432 table, identity id 0"""
+        assert investigator.group_order == 432
+        assert investigator.mul.shape == (432, 432)
+        assert investigator.identity_id == 0
+
+    def test_pair_sizes_match_closure(self, investigator):
+        """Every pair's closure size matches generate_closure; 11 of 15 pairs generate 432"""
+        pairs = list(itertools.combinations(range(investigator.n_ops), 2))
+        expected = [len(generate_closure(E46_GENERATORS[list(pair)])[0]) for pair in pairs]
+        assert investigator.pair_closure_sizes(pairs) == expected
+        sizes = [investigator.group_size(investigator.generate_group(
+                     [investigator.op_ids[i], investigator.op_ids[j]], max_size=432)) for i, j in pairs]
+        assert sizes == expected
+        assert expected.count(432) == 11
+
+    def test_orders_match_matrix_powers(self, investigator):
+        """order() agrees with repeated matrix multiplication mod 3"""
+        for M, g in zip(E46_GENERATORS, investigator.op_ids):
+            power, n = M.astype(int), 1
+            while not np.array_equal(power, np.eye(3, dtype=int)):
+                power, n = (power @ M) % 3, n + 1
+            assert investigator.order(g) == n
+
+    def test_verify_minimality(self, investigator):
+        """A generating pair is minimal; adding a third operator is not"""
+        assert investigator.verify_minimality([0, 1])
+        assert not investigator.verify_minimality([0, 1, 2])
+
+    def test_triples_seeded_from_pairs(self, investigator):
+        """Triple closures match generate_closure, with and without cached pair closures"""
+        triples = list(itertools.combinations(range(investigator.n_ops), 3))
+        expected = [len(generate_closure(E46_GENERATORS[list(t)])[0]) for t in triples]
+        fresh = MinimalGenerationInvestigator(E46_GENERATORS)
+        assert [fresh.triple_closure_size(t) for t in triples] == expected
+
+        investigator.pair_closure_sizes(list(itertools.combinations(range(investigator.n_ops), 2)))
+        assert [investigator.triple_closure_size(t) for t in triples] == expected
+        results = investigator.test_triples(sample_size=20)
+        assert results['total_tested'] == 20
+        assert sorted(results['subgroup_sizes']) == sorted(expected)
+
+class TestBitslicedProducts:
+    """
+    Bitsliced fallback agrees with NumPy arithmetic and with the Cayley table
+    """
+
+    def test_bitslice_roundtrip(self):
+        """unbitslice(bitslice(M)) == M on a sample of all 3×3 matrices"""
+        E = all_matrices_f3()
+        for a in np.random.default_rng(0).integers(0, len(E), size=200):
+            assert np.array_equal(unbitslice(*bitslice(E[a])), E[a])
+
+    def test_bs_mul_matches_matmul(self):
+        """_bs_mul == (A @ B) % 3 on a sample of all 3×3 matrices"""
+        E = all_matrices_f3()
+        for a, b in np.random.default_rng(1).integers(0, len(E), size=(1000, 2)):
+            product = unbitslice(*_bs_mul(*bitslice(E[a]), *bitslice(E[b])))
+            assert np.array_equal(product, (E[a].astype(int) @ E[b]) % 3)
+
+    def test_lazy_table_matches_cayley_table(self, monkeypatch):
+        """MAX_CAYLEY_ORDER below 432 forces the lazy path: same pair sizes and orders"""
+        operators = E46_GENERATORS
+        pairs = list(itertools.combinations(range(len(operators)), 2))
+        tabulated = MinimalGenerationInvestigator(operators)
+
+        monkeypatch.setattr(MinimalGenerationInvestigator, 'MAX_CAYLEY_ORDER', 100)
+        lazy = MinimalGenerationInvestigator(operators)
+        assert isinstance(lazy.mul, LazyProductTable)
+
+        assert lazy.pair_closure_sizes(pairs) == tabulated.pair_closure_sizes(pairs)
+        assert ([lazy.order(g) for g in lazy.op_ids]
+                == [tabulated.order(g) for g in tabulated.op_ids])
 
 
 def main():
@@ -380,17 +787,8 @@ def main():
     output_path.parent.mkdir(exist_ok=True)
 
     with open(output_path, 'w') as f:
-        # Convert numpy types for JSON serialization
-        def convert(obj):
-            if isinstance(obj, np.integer):
-                return int(obj)
-            elif isinstance(obj, np.floating):
-                return float(obj)
-            elif isinstance(obj, np.ndarray):
-                return obj.tolist()
-            return obj
-
-        json.dump(results, f, indent=2, default=convert)
+        # All values are built-in ints/floats already (cast where results are filled)
+        json.dump(results, f, indent=2)
 
     print(f"\nResults saved to {output_path}")
 
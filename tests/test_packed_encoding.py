@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# 432 Doubly Stochastic Matrices Over F₃
+# Paper: "Doubly Stochastic Matrices Over F₃: Binary Trace Stratification"
+# Repository: https://github.com/boonespacedog/ternary-constraint-432-element-group
+# Updated: 2026-10-14
+
+"""
+Test Suite: Packed uint32 encoding of 3×3 matrices over F₃
+Checks the shared helpers in gl3_f3.py against the plain NumPy representation
+"""
+
+import pytest
+import numpy as np
+
+from gl3_f3 import (IDENTITY_CODE, MOD3, closure_packed, conservation_packed,
+                    generate_closure, mod3_small, mul_packed, pack, pack_scalar,
+                    row_and_col_packed, scan_pairs, unpack)
+
+class TestPackedEncoding:
+    """
+    Round-trip and uniqueness checks for the 2-bit-per-entry encoding
+    """
+
+    def test_pack_roundtrip(self, gl3, gl3_packed):
+        """unpack(pack(M)) == M for every GL(3,F₃) matrix"""
+        assert gl3_packed.dtype == np.uint32
+        assert np.array_equal(unpack(gl3_packed), gl3)
+
+    def test_packed_codes_distinct(self, gl3_packed):
+        """Oracle: 11,232 distinct codes, all within 18 bits"""
+        assert len(np.unique(gl3_packed)) == 11232
+        assert int(gl3_packed.max()) < (1 << 18)
+
+    def test_pack_scalar_matches_pack(self, gl3, gl3_packed):
+        """pack_scalar agrees with the vectorized pack on every GL(3,F₃) matrix"""
+        assert [pack_scalar(M) for M in gl3] == gl3_packed.tolist()
+
+    def test_pack_single_matrix(self):
+        """Entry (i, j) occupies bits 2*(3i+j) .. 2*(3i+j)+1"""
+        M = np.array([[1,0,0], [0,2,0], [0,0,1]])
+        expected = (1 << 0) | (2 << 8) | (1 << 16)
+        assert int(pack(M)) == expected
+        assert np.array_equal(unpack(expected), M)
+
+class TestPackedKernels:
+    """
+    Packed-code kernels agree with NumPy arithmetic mod 3
+    """
+
+    def test_mul_packed_matches_matmul(self, gl3, gl3_packed):
+        """mul_packed(pack(A), pack(B)) == pack((A @ B) % 3) on a sample"""
+        rng = np.random.default_rng(42)
+        for a, b in rng.integers(0, len(gl3), size=(200, 2)):
+            expected = int(pack((gl3[a].astype(int) @ gl3[b]) % 3))
+            assert int(mul_packed(gl3_packed[a], gl3_packed[b])) == expected
+
+    def test_conservation_packed_yields_432(self, gl3_packed):
+        """Oracle: 432 row stochastic codes"""
+        count = sum(1 for code in gl3_packed if conservation_packed(code))
+        assert count == 432, f"Expected 432, got {count}"
+
+    def test_row_and_col_packed_yields_54(self, gl3_packed):
+        """Oracle: 54 doubly stochastic codes"""
+        count = sum(1 for code in gl3_packed if row_and_col_packed(code))
+        assert count == 54, f"Expected 54, got {count}"
+
+    def test_mod3_tables(self):
+        """MOD3 lookup and mod3_small agree with % 3 on their domains"""
+        assert np.array_equal(MOD3, np.arange(len(MOD3)) % 3)
+        assert [mod3_small(x) for x in range(9)] == [x % 3 for x in range(9)]
+
+    def test_closure_packed_cyclic(self):
+        """Closure of a single 3-cycle is the cyclic group of order 3"""
+        P = np.array([[0,1,0], [0,0,1], [1,0,0]])
+        codes = closure_packed(pack(P[None]))
+        assert len(codes) == 3
+        assert IDENTITY_CODE in set(int(c) for c in codes)
+
+    def test_closure_max_size_is_exact(self):
+        """Both closure backends stop at exactly max_size elements"""
+        M1 = np.array([[0,1,0], [0,2,2], [1,0,0]])
+        M2 = np.array([[0,1,0], [0,2,2], [1,2,1]])
+        assert len(closure_packed(pack(np.array([M1, M2])))) == 432
+        for max_size in (1, 5, 50, 431):
+            G, codes = generate_closure([M1, M2], max_size=max_size)
+            assert len(G) == len(codes) == max_size
+            assert set(int(c) for c in pack(G)) == codes
+            assert len(closure_packed(pack(np.array([M1, M2])), max_size)) == max_size
+
+    def test_scan_pairs_cyclic_table(self):
+        """On the Z_12 addition table, <a, b> has order 12 / gcd(a, b, 12)"""
+        n = 12
+        mul = ((np.arange(n)[:, None] + np.arange(n)) % n).astype(np.uint16)
+        pairs = np.array([[1, 0], [2, 4], [4, 6], [3, 8], [0, 0]], dtype=np.int64)
+        sizes = np.empty(len(pairs), dtype=np.int64)
+        seen = np.empty((len(pairs), n), dtype=np.uint8)
+        scan_pairs(mul, pairs, 0, n, sizes, seen)
+        assert sizes.tolist() == [12, 6, 6, 12, 1]
+        assert np.flatnonzero(seen[1]).tolist() == [0, 2, 4, 6, 8, 10]
+        assert seen.sum(axis=1).tolist() == sizes.tolist()
+        scan_pairs(mul, pairs, 0, 5, sizes, seen)
+        assert sizes.tolist() == [5, 5, 5, 5, 1]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])